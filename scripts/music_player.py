@@ -20,16 +20,30 @@ Requirements:
 import os
 import sys
 import curses
+import functools
 import subprocess
 import random
 import re
+import select
+import shutil
 import signal
 import json
 import socket
 import tempfile
+import textwrap
+import threading
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# Prefer a faster JSON decoder for the mpv event stream when one is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
 
 # ============================================================================
 # Configuration
@@ -41,6 +55,12 @@ PLAYLISTS_DIR = Path.home() / "Music" / "playlists"
 # Media player command (can be changed to mpg123, mplayer, etc.)
 PLAYER_CMD = "mpv"
 
+# Matches the artist/title lines of ffprobe's default output format
+_TAG_RE = re.compile(rb'^(?:TAG:)?(artist|title)=(.+?)\r?$', re.IGNORECASE | re.MULTILINE)
+
+# On-disk cache of song metadata, so ffprobe only runs once per file version
+METADATA_CACHE = Path.home() / ".cache" / "music_player" / "metadata.json"
+
 
 # ============================================================================
 # MusicPlayer Class
@@ -53,7 +73,7 @@ class MusicPlayer:
     
     Attributes:
         stdscr: Curses window object
-        playlists: List of available playlist names
+        playlists: Tuple of available playlist names
         current_playlist: Name of currently playing playlist
         current_song_index: Index of current song in playlist
         songs: List of song file paths in current playlist
@@ -63,7 +83,12 @@ class MusicPlayer:
         selected_index: Index of selected playlist in UI
         paused: Whether playback is currently paused
         ipc_socket: Path to mpv IPC socket for control
+        playlist_file: Path to the temporary playlist file mpv is playing
+        _meta_cache: Song info keyed by (path, mtime, size), persisted to disk
     """
+    # Widest progress bar that will be drawn, in characters
+    MAX_BAR = 1024
+    
     def __init__(self, stdscr):
         """
         Initialize the music player with ncurses interface.
@@ -76,27 +101,72 @@ class MusicPlayer:
         self.selected_index = 0
         
         # Playlist management
-        self.playlists = []
+        self.playlists = ()
+        self._n_playlists = 0
         self.current_playlist = None
         self.songs = []
         self.current_song_index = 0
         self.shuffle = False
+        self._rng = random.Random()  # Private generator for shuffling
         
         # Playback control
         self.player_process = None
         self.ipc_socket = None  # Path to mpv IPC socket for control
+        self.playlist_file = None  # Song list handed to mpv
+        # Persistent IPC connection for commands, shared between threads
+        self._ipc_sock = None
+        self._ipc_reader = None
+        self._ipc_lock = threading.Lock()
+        self._ipc_request_id = 0
+        # Set once mpv accepted a connection, see _wait_ipc_ready()
+        self._ipc_ready = False
         self.paused = False
         self.current_song_info = ""
+        # Latest (position, duration, percentage), updated by the progress thread
+        self._progress = (0, 0, 0)
+        
+        # Metadata cache, loaded once and written back on exit if changed
+        self._meta_cache = self._load_meta_cache()
+        self._meta_cache_dirty = False
+        
+        # Parsed playlists, keyed by path and validated by mtime
+        self._playlist_cache = {}
+        
+        # Background workers that warm the metadata cache for a playlist.
+        # Imported here, the dependency check path never needs it.
+        from concurrent.futures import ThreadPoolExecutor
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="metadata")
+        self._prefetch_futures = {}  # Song path -> pending or finished lookup
+        self._prefetched_playlist = None
+        
+        # Single worker that sends mpv commands in order, so connecting to
+        # mpv and waiting for its replies never blocks the UI thread
+        self._ipc_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ipc")
         
         # Initialize curses settings
         curses.curs_set(0)  # Hide cursor
         curses.use_default_colors()  # Use terminal default colors
-        self.stdscr.nodelay(1)  # Non-blocking input
-        self.stdscr.timeout(200)  # Refresh every 200ms to reduce flickering
+        self.stdscr.nodelay(1)  # Non-blocking input, waiting happens in select()
+        
+        # Self-pipe that wakes the main loop when background threads or
+        # signals have something new to show
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._prev_sigwinch = signal.signal(signal.SIGWINCH, lambda signum, frame: self._wake())
         
-        # Track screen size for efficient redraws
-        self._last_height = None
-        self._last_width = None
+        # Screen regions that need repainting on the next draw()
+        self._dirty = {"playlist": True, "status": True, "progress": True, "help": True}
+        # Rendered playlist rows, see _rebuild_row_cache()
+        self._row_cache = []
+        # Segments last drawn on each screen row, see _draw_line()
+        self._line_cache = {}
+        
+        # Progress bar characters, sliced per frame instead of rebuilt
+        self._full_bar = "█" * self.MAX_BAR
+        self._empty_bar = "░" * self.MAX_BAR
+        # (filled, bar_width) of the progress bar currently on screen
+        self._drawn_bar = None
         
         # Initialize cyberpunk color scheme
         # Color pairs are used throughout the UI for consistent theming
@@ -117,24 +187,71 @@ class MusicPlayer:
         # Pair 8: Progress bar unfilled - Dim cyan for visibility
         curses.init_pair(8, curses.COLOR_CYAN, -1)
         
-    def load_playlists(self):
+        # Combined attributes, resolved once instead of on every draw
+        self.ATTR_SELECTED = curses.color_pair(1) | curses.A_BOLD
+        self.ATTR_PLAYING = curses.color_pair(2) | curses.A_BOLD
+        self.ATTR_SHUFFLE = curses.color_pair(3) | curses.A_BOLD
+        self.ATTR_NORMAL = curses.color_pair(4)
+        self.ATTR_TIME = curses.color_pair(4) | curses.A_BOLD
+        self.ATTR_TITLE = curses.color_pair(5) | curses.A_BOLD
+        self.ATTR_PAUSED = curses.color_pair(6) | curses.A_BOLD
+        self.ATTR_BAR_FILLED = curses.color_pair(7) | curses.A_BOLD
+        self.ATTR_BAR_EMPTY = curses.color_pair(8)
+        
+    def load_playlists(self) -> Tuple[str, ...]:
         """
         Scan the playlists directory for M3U8 files.
         
         Returns:
-            List of playlist names (filenames without .m3u8 extension),
-            sorted alphabetically. Returns empty list if directory doesn't exist.
+            Tuple of playlist names (filenames without .m3u8 extension),
+            sorted alphabetically. Returns empty tuple if directory doesn't
+            exist. The list never changes while the player runs, so it is
+            kept immutable.
         """
         if not PLAYLISTS_DIR.exists():
-            return []
+            return ()
         
-        playlists = []
-        # Find all .m3u8 files in the playlists directory
-        for file in PLAYLISTS_DIR.glob("*.m3u8"):
-            # Use stem to get filename without extension
-            playlists.append(file.stem)
+        # Use stem to get filename without extension
+        return tuple(sorted(file.stem for file in PLAYLISTS_DIR.glob("*.m3u8")))
+    
+    def _load_meta_cache(self) -> Dict[Tuple[str, int, int], str]:
+        """
+        Load the persistent metadata cache from disk.
         
-        return sorted(playlists)
+        Returns:
+            Dictionary mapping (path, mtime, size) to "Artist - Title".
+            Returns empty dict if the cache file is missing or unreadable.
+        """
+        try:
+            with open(METADATA_CACHE, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            # JSON has no tuple keys, so entries are stored as flat lists
+            return {(path, mtime, size): info for path, mtime, size, info in entries}
+        except (OSError, json.JSONDecodeError, TypeError, ValueError):
+            return {}
+    
+    def _save_meta_cache(self):
+        """
+        Write the metadata cache back to disk if it gained new entries.
+        
+        Writes to a temporary file first and renames it into place so an
+        interrupted write never leaves a truncated cache behind.
+        """
+        if not self._meta_cache_dirty:
+            return
+        
+        entries = [[path, mtime, size, info]
+                   for (path, mtime, size), info in list(self._meta_cache.items())]
+        try:
+            METADATA_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = METADATA_CACHE.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, METADATA_CACHE)
+            self._meta_cache_dirty = False
+        except OSError:
+            # Cache is only an optimization, never fail because of it
+            pass
     
     def parse_m3u8(self, playlist_name: str) -> List[str]:
         """
@@ -144,6 +261,9 @@ class MusicPlayer:
         1. Relative to the playlists directory
         2. Relative to ~/Music/
         
+        Parsed results are cached per playlist file and reused until the
+        file's modification time changes.
+        
         Args:
             playlist_name: Name of the playlist (without .m3u8 extension)
         
@@ -152,32 +272,174 @@ class MusicPlayer:
             playlist file doesn't exist or contains no valid songs.
         """
         playlist_path = PLAYLISTS_DIR / f"{playlist_name}.m3u8"
-        if not playlist_path.exists():
+        try:
+            mtime = playlist_path.stat().st_mtime_ns
+        except OSError:
             return []
         
-        songs = []
-        with open(playlist_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments (lines starting with #) and empty lines
-                if line and not line.startswith('#'):
-                    # Handle absolute paths (starting with /)
-                    if os.path.isabs(line):
-                        song_path = Path(line)
-                    else:
-                        # Try relative to playlist directory first
-                        song_path = PLAYLISTS_DIR / line
-                        if not song_path.exists():
-                            # Fallback: try relative to Music directory
-                            song_path = Path.home() / "Music" / line
-                    
-                    # Only add songs that actually exist
-                    if song_path.exists():
-                        songs.append(str(song_path))
+        cached = self._playlist_cache.get(playlist_path)
+        if cached and cached[0] == mtime:
+            # Return a copy, callers shuffle the list in place
+            return list(cached[1])
+        
+        try:
+            raw = playlist_path.read_text(encoding='utf-8', errors='ignore').splitlines()
+        except OSError:
+            return []
+        # Skip comments (lines starting with #) and empty lines
+        lines = [line for line in map(str.strip, raw) if line and line[0] != '#']
+        
+        playlists_dir = str(PLAYLISTS_DIR)
+        music_dir = str(Path.home() / "Music")
+        
+        # Most entries are plain file names in one of the two base directories.
+        # List each of those directories once and test membership, instead of
+        # a stat() per song.
+        listings = {}
+        
+        def in_directory(directory: str, name: str) -> bool:
+            if directory not in listings:
+                try:
+                    with os.scandir(directory) as it:
+                        listings[directory] = {entry.name for entry in it}
+                except OSError:
+                    listings[directory] = None  # Can't list, stat instead
+            entries = listings[directory]
+            if entries is None:
+                return os.path.exists(os.path.join(directory, name))
+            return name in entries
+        
+        def resolve(line: str) -> Optional[str]:
+            # Handle absolute paths (starting with /)
+            if os.path.isabs(line):
+                return line if os.path.exists(line) else None
+            
+            if '/' not in line:
+                # Try relative to playlist directory first,
+                # then fall back to the Music directory
+                if in_directory(playlists_dir, line):
+                    return os.path.join(playlists_dir, line)
+                if in_directory(music_dir, line):
+                    return os.path.join(music_dir, line)
+                return None
+            
+            # Paths into subdirectories are checked individually
+            song_path = os.path.join(playlists_dir, line)
+            if os.path.exists(song_path):
+                return song_path
+            song_path = os.path.join(music_dir, line)
+            return song_path if os.path.exists(song_path) else None
         
-        return songs
+        # Only add songs that actually exist
+        songs = [song_path for song_path in map(resolve, lines) if song_path]
+        
+        self._playlist_cache[playlist_path] = (mtime, songs)
+        return list(songs)
     
     def get_song_info(self, song_path: str) -> str:
+        """
+        Get artist and title information for a song, using the metadata cache.
+        
+        Files already named "Artist - Title" are used as-is without running
+        ffprobe at all. Other files are probed once and the result is cached,
+        keyed by the file's path, modification time and size, so an edited or
+        replaced file is probed again automatically.
+        
+        Args:
+            song_path: Path to the song file
+        
+        Returns:
+            Formatted string "Artist - Title" or filename if extraction fails
+        """
+        info = self._filename_song_info(song_path)
+        if info is not None:
+            return info
+        
+        key = self._meta_key(song_path)
+        if key is None:
+            return self._probe_song_info(song_path)[0]
+        
+        info = self._meta_cache.get(key)
+        if info is None:
+            info, probed = self._probe_song_info(song_path)
+            # Filename fallbacks (no ffprobe, timeout) are retried next time
+            if probed:
+                self._meta_cache[key] = info
+                self._meta_cache_dirty = True
+        return info
+    
+    def _filename_song_info(self, song_path: str) -> Optional[str]:
+        """
+        Get song information from a well-formed "Artist - Title" file name.
+        
+        Args:
+            song_path: Path to the song file
+        
+        Returns:
+            "Artist - Title", or None if the file name doesn't have that form.
+        """
+        stem = os.path.splitext(os.path.basename(song_path))[0]
+        artist, sep, title = stem.partition(" - ")
+        if sep and artist and title:
+            return stem
+        return None
+    
+    def _meta_key(self, song_path: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Build the metadata cache key for a song file.
+        
+        Args:
+            song_path: Path to the song file
+        
+        Returns:
+            Tuple of (path, mtime, size), or None if the file can't be stat'ed.
+        """
+        try:
+            st = os.stat(song_path)
+        except OSError:
+            return None
+        return (song_path, int(st.st_mtime), st.st_size)
+    
+    def _show_song_info(self, index: int):
+        """
+        Display information for the song at index without waiting on ffprobe.
+        
+        Cached information is shown right away. On a cache miss the file name
+        is shown while the prefetch pool probes the file, reusing a lookup
+        that is already queued for it, and the status line is updated once
+        the result is in, unless the song changed in the meantime. Keeps the
+        UI and the IPC event thread from blocking on a subprocess.
+        
+        Args:
+            index: Index of the song in self.songs
+        """
+        song_path = self.songs[index]
+        info = self._filename_song_info(song_path)
+        if info is None:
+            key = self._meta_key(song_path)
+            info = self._meta_cache.get(key) if key else None
+        if info is not None:
+            self.current_song_info = info
+            return
+        
+        self.current_song_info = Path(song_path).stem
+        
+        def resolved(future):
+            if future.cancelled():
+                return
+            songs = self.songs
+            if self.current_song_index < len(songs) and songs[self.current_song_index] == song_path:
+                self.current_song_info = future.result()
+                self._dirty["status"] = True
+                self._wake()
+        
+        future = self._prefetch_futures.get(song_path)
+        if future is None or future.cancelled():
+            future = self._prefetch_pool.submit(self.get_song_info, song_path)
+            self._prefetch_futures[song_path] = future
+        future.add_done_callback(resolved)
+    
+    def _probe_song_info(self, song_path: str) -> Tuple[str, bool]:
         """
         Extract artist and title information from a song file.
         
@@ -191,44 +453,45 @@ class MusicPlayer:
             song_path: Path to the song file
         
         Returns:
-            Formatted string "Artist - Title" or filename if extraction fails
+            Tuple of the formatted string "Artist - Title" (or the filename if
+            extraction fails) and whether it came from a successful ffprobe run
         """
         try:
             # Method 1: Try to get metadata using ffprobe (if available)
+            # Only the two tags we use are requested, as plain key=value lines
             try:
                 result = subprocess.run(
-                    ['ffprobe', '-v', 'quiet', '-print_format', 'json', '-show_format', song_path],
+                    [
+                        'ffprobe', '-v', 'quiet',
+                        '-show_entries', 'format_tags=artist,title',
+                        '-of', 'default=noprint_wrappers=1:nokey=0',
+                        song_path
+                    ],
                     capture_output=True,
-                    text=True,
-                    timeout=2
+                    timeout=0.5
                 )
                 if result.returncode == 0:
-                    data = json.loads(result.stdout)
-                    format_info = data.get('format', {}).get('tags', {})
-                    # Try different tag name variations
-                    artist = format_info.get('artist') or format_info.get('ARTIST') or 'Unknown Artist'
-                    title = format_info.get('title') or format_info.get('TITLE') or 'Unknown Title'
-                    return f"{artist} - {title}"
-            except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
+                    # Tag names may be upper or lower case depending on format
+                    tags = {name.lower(): value for name, value in _TAG_RE.findall(result.stdout)}
+                    artist = tags.get(b'artist', b'').decode('utf-8', 'replace') or 'Unknown Artist'
+                    title = tags.get(b'title', b'').decode('utf-8', 'replace') or 'Unknown Title'
+                    return f"{artist} - {title}", True
+            except (subprocess.TimeoutExpired, FileNotFoundError):
                 # ffprobe not available or failed, continue to fallback
                 pass
             
             # Method 2: Extract from filename
             filename = Path(song_path).stem  # Get filename without extension
             # Try to parse "Artist - Title" format
-            if ' - ' in filename:
-                parts = filename.split(' - ', 1)
-                return f"{parts[0]} - {parts[1]}"
-            # Try to parse "Artist_Title" format
-            elif '_' in filename:
-                parts = filename.split('_', 1)
-                return f"{parts[0]} - {parts[1]}"
-            # Use filename as-is
-            else:
-                return filename
+            artist, sep, title = filename.partition(' - ')
+            if not sep:
+                # Try to parse "Artist_Title" format
+                artist, sep, title = filename.partition('_')
+            # Use filename as-is if there is no separator
+            return (f"{artist} - {title}" if sep else filename), False
         except Exception:
             # Final fallback: just return the filename
-            return Path(song_path).stem
+            return Path(song_path).stem, False
     
     def start_playlist(self, playlist_name: str):
         """
@@ -244,63 +507,391 @@ class MusicPlayer:
         self.songs = self.parse_m3u8(playlist_name)
         
         if not self.songs:
-            return  # No songs found in playlist
+            # No songs found in playlist, don't leave mpv looping the old one
+            # and don't show it as playing
+            self.stop_playback()
+            self.current_playlist = None
+            self.current_song_info = f"No playable songs in {playlist_name}"
+            self.paused = False
+            self._dirty["status"] = True
+            self._dirty["progress"] = True
+            return
         
         # Apply shuffle if enabled
         if self.shuffle:
-            random.shuffle(self.songs)
+            self._rng.shuffle(self.songs)
         
-        # Start from the beginning
+        # Start from the beginning with a fresh mpv for the new song list
+        self.stop_playback()
         self.current_song_index = 0
         self.play_current_song()
+        self.prefetch_song_info(playlist_name)
+    
+    def prefetch_song_info(self, playlist_name: str):
+        """
+        Resolve song information for the loaded playlist in the background.
+        
+        ffprobe calls are mostly spent waiting on the subprocess, so running
+        a few in parallel fills the metadata cache long before the user skips
+        ahead. Pending work for a previously loaded playlist is cancelled, and
+        replaying the same playlist does not queue it again.
+        
+        Args:
+            playlist_name: Name of the playlist the current songs belong to
+        """
+        if playlist_name == self._prefetched_playlist:
+            return
+        
+        # Keep the lookup for the song on screen, cancel the rest
+        current = self.songs[self.current_song_index]
+        futures = {}
+        for song, future in self._prefetch_futures.items():
+            if song == current:
+                futures[song] = future
+            else:
+                future.cancel()
+        
+        # Queue in play order so the next songs are resolved first
+        for song in self.songs[self.current_song_index + 1:]:
+            if song not in futures:
+                futures[song] = self._prefetch_pool.submit(self.get_song_info, song)
+        self._prefetch_futures = futures
+        self._prefetched_playlist = playlist_name
     
     def play_current_song(self):
         """
         Start playing the song at the current index.
         
-        Stops any currently playing song, extracts song information, and
-        launches mpv with IPC enabled for control. The IPC socket allows
-        us to pause/resume and query playback state.
+        A single mpv instance plays the whole playlist. If it is already
+        running, it is told to jump to the current index over IPC, which
+        avoids spawning a new process per song. Otherwise mpv is launched
+        with the playlist, starting at the current index.
         """
         if not self.songs or self.current_song_index >= len(self.songs):
             return  # No songs or invalid index
         
-        # Stop any currently playing song
-        self.stop_playback()
-        
         # Get song information for display
-        song_path = self.songs[self.current_song_index]
-        self.current_song_info = self.get_song_info(song_path)
+        self._show_song_info(self.current_song_index)
         self.paused = False  # Reset pause state when starting new song
         
+        if self.player_process and self.player_process.poll() is None:
+            # mpv is running the playlist already, just switch tracks
+            self._ipc_post([
+                {"command": ["playlist-play-index", self.current_song_index]},
+                {"command": ["set_property", "pause", False]},
+            ])
+            return
+        
+        self.launch_player()
+    
+    def launch_player(self):
+        """
+        Launch mpv for the current playlist, starting at the current index.
+        
+        The song list is written to a temporary playlist file and mpv runs
+        idle with playlist looping, so it stays alive for the whole session
+        and wraps around at the end like next_song() does. A background
+        thread follows its progress and playlist position.
+        """
+        # Stop any previous mpv instance
+        self.stop_playback()
+        
         # Create unique IPC socket path using process ID
         # This allows multiple instances to run without conflicts
         self.ipc_socket = str(Path(tempfile.gettempdir()) / f"mpv_music_player_{os.getpid()}.sock")
+        try:
+            # mkstemp creates the playlist file exclusively, so a file or
+            # symlink planted at a guessable path is never written through
+            fd, self.playlist_file = tempfile.mkstemp(prefix="mpv_music_player_", suffix=".m3u")
+            with open(fd, 'w', encoding='utf-8') as f:
+                f.write("\n".join(self.songs) + "\n")
+        except OSError:
+            self.current_song_info = "Error: could not write playlist file"
+            return
         
         # Start mpv in background with IPC enabled
         try:
             self.player_process = subprocess.Popen(
                 [
                     PLAYER_CMD,
-                    '--no-terminal',      # Don't show terminal output
-                    '--no-video',          # Audio-only mode
+                    '--idle=yes',            # Keep running between tracks
+                    '--loop-playlist=inf',   # Wrap around at the end
+                    '--no-terminal',         # Don't show terminal output
+                    '--no-video',            # Audio-only mode
                     '--input-ipc-server=' + self.ipc_socket,  # Enable IPC for control
-                    song_path
+                    '--playlist-start=' + str(self.current_song_index),
+                    '--playlist=' + self.playlist_file
                 ],
                 stdout=subprocess.DEVNULL,  # Suppress output
                 stderr=subprocess.DEVNULL    # Suppress errors
             )
-            # Give mpv a moment to start the IPC server before we try to use it
-            time.sleep(0.1)
         except FileNotFoundError:
             self.current_song_info = f"Error: {PLAYER_CMD} not found"
+            return
+        
+        # Follow playback progress in the background for this mpv instance
+        threading.Thread(
+            target=self._progress_loop,
+            args=(self.player_process, self.ipc_socket),
+            daemon=True
+        ).start()
+    
+    def _ipc_post(self, commands: List[dict], on_failure=None):
+        """
+        Queue commands for the IPC worker thread and return immediately.
+        
+        Commands are sent in the order they were queued. They are dropped if
+        the mpv they were meant for has been replaced or stopped by the time
+        the worker gets to them.
+        
+        Args:
+            commands: mpv JSON IPC commands, see _ipc_send_many()
+            on_failure: Called on the worker thread if any command got no reply
+        """
+        process = self.player_process
+        
+        def send():
+            if process is not self.player_process:
+                return
+            replies = self._ipc_send_many(commands)
+            if on_failure is not None and not all(replies):
+                on_failure()
+        
+        self._ipc_pool.submit(send)
+    
+    def _ipc_send(self, command: dict) -> dict:
+        """
+        Send a single command to mpv over the persistent IPC connection.
+        
+        Args:
+            command: mpv JSON IPC command, e.g. {"command": ["cycle", "pause"]}
+        
+        Returns:
+            mpv's reply to the command, or an empty dict if IPC failed.
+        """
+        return self._ipc_send_many([command])[0]
+    
+    def _ipc_send_many(self, commands: List[dict]) -> List[dict]:
+        """
+        Send several commands to mpv in one write and collect their replies.
+        
+        The connection is opened on first use and kept for later commands.
+        Each command carries a request_id so its reply can be told apart from
+        the others and from events mpv broadcasts on the same connection;
+        replies are read until every request has been answered. If the
+        connection fails before the commands were sent, the socket is
+        reopened once and the batch retried. Commands are never sent twice.
+        
+        Args:
+            commands: mpv JSON IPC commands, e.g. {"command": ["cycle", "pause"]}
+        
+        Returns:
+            mpv's replies in the same order as the commands, with an empty
+            dict for every command whose reply was not received.
+        """
+        replies = [{} for _ in commands]
+        if not self.ipc_socket or not commands:
+            return replies
+        
+        with self._ipc_lock:
+            for _ in range(2):
+                sent = False
+                try:
+                    if self._ipc_sock is None:
+                        self._ipc_connect()
+                    
+                    first_id = self._ipc_request_id + 1
+                    self._ipc_request_id += len(commands)
+                    payload = "".join(
+                        json.dumps(dict(command, request_id=first_id + offset)) + "\n"
+                        for offset, command in enumerate(commands)
+                    )
+                    self._ipc_sock.sendall(payload.encode('utf-8'))
+                    sent = True
+                    
+                    pending = len(commands)
+                    while pending:
+                        line = self._ipc_reader.readline()
+                        if not line:
+                            raise ConnectionError("mpv closed the IPC connection")
+                        reply = json_loads(line)
+                        index = reply.get('request_id', 0) - first_id
+                        if 0 <= index < len(commands) and not replies[index]:
+                            replies[index] = reply
+                            pending -= 1
+                    return replies
+                except ConnectionRefusedError:
+                    # mpv is gone, no point retrying
+                    self._ipc_ready = False
+                    self._ipc_close()
+                    break
+                except (OSError, ValueError):
+                    self._ipc_close()
+                    if sent:
+                        break  # mpv may have run them already
+        return replies
+    
+    def _ipc_connect(self):
+        """
+        Open the persistent IPC connection to mpv.
+        
+        mpv creates its socket shortly after startup, so connecting is
+        retried briefly while the player process is alive. Must be called
+        with self._ipc_lock held.
+        
+        Raises:
+            OSError: If mpv is not accepting connections
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(0.5)  # Short timeout to avoid blocking the UI
+        deadline = time.monotonic() + 1.0
+        while True:
+            try:
+                sock.connect(self.ipc_socket)
+                break
+            except (FileNotFoundError, ConnectionRefusedError):
+                player_alive = self.player_process and self.player_process.poll() is None
+                if not player_alive or time.monotonic() > deadline:
+                    sock.close()
+                    raise
+                time.sleep(0.01)
+        self._ipc_sock = sock
+        self._ipc_reader = sock.makefile('rb')
+    
+    def _ipc_close(self):
+        """
+        Close the persistent IPC connection, if open.
+        
+        Must be called with self._ipc_lock held.
+        """
+        if self._ipc_sock is not None:
+            self._ipc_reader.close()
+            self._ipc_sock.close()
+            self._ipc_sock = None
+            self._ipc_reader = None
+    
+    def _progress_loop(self, process: subprocess.Popen, ipc_socket: str):
+        """
+        Keep progress, pause state and the current song up to date for one mpv instance.
+        
+        Runs on a background thread with a single IPC connection for the
+        lifetime of the player. mpv pushes property-change events for the
+        observed properties, so the UI thread never waits on the socket.
+        When mpv moves to another playlist entry on its own (song ended),
+        current_song_index and current_song_info follow it. The loop ends
+        when mpv exits and closes the connection.
+        
+        Args:
+            process: The mpv process whose progress is tracked
+            ipc_socket: Path to that process's IPC socket
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            if not self._wait_ipc_ready(sock, process, ipc_socket):
+                return
+            
+            sock.sendall(
+                b'{"command": ["observe_property", 1, "time-pos"]}\n'
+                b'{"command": ["observe_property", 2, "duration"]}\n'
+                b'{"command": ["observe_property", 3, "playlist-pos"]}\n'
+                b'{"command": ["observe_property", 4, "pause"]}\n'
+            )
+            
+            position = 0.0
+            duration = 0.0
+            shown_second = -1
+            with sock.makefile('rb') as events:
+                for line in events:
+                    try:
+                        message = json_loads(line)
+                    except ValueError:
+                        continue
+                    if message.get('event') != 'property-change':
+                        continue  # Command replies and other events
+                    
+                    data = message.get('data')
+                    if message.get('name') == 'playlist-pos':
+                        if process is self.player_process and data is not None \
+                           and 0 <= data < len(self.songs) and data != self.current_song_index:
+                            self.current_song_index = data
+                            self._show_song_info(data)
+                            self._dirty["status"] = True
+                            self._wake()
+                        continue
+                    elif message.get('name') == 'pause':
+                        # Also catches pauses not made from this UI (e.g. MPRIS)
+                        if process is self.player_process and isinstance(data, bool) \
+                           and data != self.paused:
+                            self.paused = data
+                            self._dirty["status"] = True
+                            self._wake()
+                        continue
+                    elif message.get('name') == 'time-pos':
+                        position = float(data) if data is not None else 0.0
+                    elif message.get('name') == 'duration':
+                        duration = float(data) if data is not None else 0.0
+                    
+                    if process is not self.player_process:
+                        return  # Song changed, a newer thread has taken over
+                    if duration > 0:
+                        # Calculate percentage, clamped between 0 and 100
+                        percentage = min(100, max(0, (position / duration) * 100))
+                        self._progress = (position, duration, percentage)
+                    else:
+                        self._progress = (0, 0, 0)
+                    
+                    # Only wake the UI when the displayed time changes,
+                    # time-pos events arrive much more often than that
+                    if int(position) != shown_second or message.get('name') == 'duration':
+                        shown_second = int(position)
+                        self._dirty["progress"] = True
+                        self._wake()
+        except OSError:
+            # Connection dropped, mpv has most likely exited
+            pass
+        finally:
+            sock.close()
+            if process is self.player_process:
+                self._ipc_ready = False
+            # Let the main loop notice the exit without waiting for a timeout
+            self._wake()
+    
+    def _wait_ipc_ready(self, sock: socket.socket, process: subprocess.Popen, ipc_socket: str) -> bool:
+        """
+        Connect to mpv's IPC socket as soon as mpv has created it.
+        
+        Retries every 10ms while mpv starts up, and sets self._ipc_ready once
+        connected so IPC callers can check the flag instead of stat'ing the
+        socket file. Runs on the progress thread, never on the UI thread.
+        
+        Args:
+            sock: Unconnected Unix socket to connect
+            process: The mpv process that will create the socket
+            ipc_socket: Path to that process's IPC socket
+        
+        Returns:
+            True once connected, False if mpv exited first.
+        """
+        while True:
+            try:
+                sock.connect(ipc_socket)
+                break
+            except (FileNotFoundError, ConnectionRefusedError):
+                if process.poll() is not None:
+                    return False
+                time.sleep(0.01)
+        
+        if process is self.player_process:
+            self._ipc_ready = True
+        return True
     
     def stop_playback(self):
         """
         Stop the currently playing song and clean up resources.
         
         Gracefully terminates the mpv process, and if that fails, kills it.
-        Also removes the IPC socket file to prevent file system clutter.
+        Also removes the IPC socket and playlist files to prevent file
+        system clutter.
         """
         if self.player_process:
             try:
@@ -314,15 +905,27 @@ class MusicPlayer:
                 # Process already terminated
                 pass
             self.player_process = None
+        self._progress = (0, 0, 0)
+        
+        with self._ipc_lock:
+            self._ipc_close()
         
         # Clean up IPC socket file
-        if self.ipc_socket and Path(self.ipc_socket).exists():
+        self._ipc_ready = False
+        if self.ipc_socket:
             try:
                 Path(self.ipc_socket).unlink()
             except OSError:
                 # File may have been removed already, ignore
                 pass
         self.ipc_socket = None
+        
+        if self.playlist_file:
+            try:
+                Path(self.playlist_file).unlink()
+            except OSError:
+                pass
+            self.playlist_file = None
     
     def next_song(self):
         """
@@ -361,26 +964,55 @@ class MusicPlayer:
         
         # If currently playing, reshuffle remaining songs only
         if self.songs and self.current_song_index < len(self.songs):
-            # Keep songs up to current index, shuffle the rest
-            remaining = self.songs[self.current_song_index + 1:]
-            if remaining:
-                random.shuffle(remaining)
-                self.songs = self.songs[:self.current_song_index + 1] + remaining
+            # Keep songs up to current index, shuffle the rest in place
+            # (Fisher-Yates over songs[lo:hi], no slice copies)
+            songs = self.songs
+            rng = self._rng
+            lo = self.current_song_index + 1
+            hi = len(songs)
+            if lo < hi:
+                for i in range(hi - 1, lo, -1):
+                    j = rng.randrange(lo, i + 1)
+                    songs[i], songs[j] = songs[j], songs[i]
+                self._sync_player_playlist()
+    
+    def _sync_player_playlist(self):
+        """
+        Replace the entries after the current song in mpv's playlist.
+        
+        Used after reshuffling so mpv continues with the remaining songs in
+        the same order as self.songs, without interrupting the current song.
+        """
+        if not self.player_process or self.player_process.poll() is not None:
+            return
+        
+        start = self.current_song_index + 1
+        try:
+            with open(self.playlist_file, 'w', encoding='utf-8') as f:
+                f.write("\n".join(self.songs[start:]) + "\n")
+        except OSError:
+            return
+        
+        # Drop the old order and append the new one in a single round-trip
+        commands = [{"command": ["playlist-remove", start]} for _ in range(start, len(self.songs))]
+        commands.append({"command": ["loadlist", self.playlist_file, "append"]})
+        self._ipc_post(commands)
     
     def toggle_play_pause(self):
         """
         Toggle playback pause state.
         
         Uses mpv's IPC interface to send pause/play commands. Falls back to
-        process signals (SIGSTOP/SIGCONT) if IPC is unavailable. Updates the
-        internal pause state to match mpv's actual state.
+        process signals (SIGSTOP/SIGCONT) if IPC is unavailable. mpv's actual
+        pause state is pushed to the progress thread via observe_property,
+        so it is not queried here.
         """
         # Check if player is running
         if not self.player_process or self.player_process.poll() is not None:
             return  # Not playing, can't pause
         
         # Fallback: Use process signals if IPC socket not available
-        if not self.ipc_socket or not Path(self.ipc_socket).exists():
+        if not self._ipc_ready:
             try:
                 if self.paused:
                     # Resume: send continue signal
@@ -397,285 +1029,324 @@ class MusicPlayer:
             return
         
         # Primary method: Use mpv IPC interface
-        try:
-            # Connect to mpv IPC socket (Unix domain socket)
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.connect(self.ipc_socket)
-            
-            # Send cycle pause command (toggles pause state in mpv)
-            command = {"command": ["cycle", "pause"]}
-            sock.send((json.dumps(command) + "\n").encode('utf-8'))
-            
-            # Read response and query actual pause state
-            response = sock.recv(1024).decode('utf-8')
-            try:
-                result = json.loads(response)
-                # Query mpv's actual pause state to sync our UI
-                status_cmd = {"command": ["get_property", "pause"]}
-                sock.send((json.dumps(status_cmd) + "\n").encode('utf-8'))
-                status_resp = sock.recv(1024).decode('utf-8')
-                status_result = json.loads(status_resp)
-                
-                # Update our state to match mpv's state
-                if 'data' in status_result:
-                    self.paused = status_result['data']
-                else:
-                    # If we can't get state, just toggle
-                    self.paused = not self.paused
-            except (json.JSONDecodeError, KeyError):
-                # If parsing fails, just toggle our state
-                self.paused = not self.paused
-            
-            sock.close()
-        except (ConnectionRefusedError, FileNotFoundError, OSError, socket.error):
+        # Set the pause state explicitly rather than cycling it, so the
+        # property-change event mpv sends (possibly before its reply) can't
+        # leave our state inverted. The new state is shown right away, the
+        # command is sent from the IPC worker.
+        paused = not self.paused
+        self.paused = paused
+        process = self.player_process
+        
+        def fallback():
             # IPC failed, fallback to signals
             try:
-                if self.paused:
-                    self.player_process.send_signal(signal.SIGCONT)
-                    self.paused = False
-                else:
-                    self.player_process.send_signal(signal.SIGSTOP)
-                    self.paused = True
+                process.send_signal(signal.SIGSTOP if paused else signal.SIGCONT)
             except (ProcessLookupError, OSError):
-                self.player_process = None
-                self.paused = False
+                if process is self.player_process:
+                    self.player_process = None
+                    self.paused = False
+                    self._dirty["status"] = True
+                    self._wake()
+        
+        self._ipc_post([{"command": ["set_property", "pause", paused]}], on_failure=fallback)
     
     def get_progress(self) -> Tuple[float, float, float]:
         """
         Get current song playback progress information.
         
-        Uses mpv IPC to query the current song's position and duration directly.
-        This ensures we get the progress of the current song, not the playlist.
+        The values are maintained by the background progress thread from
+        mpv's property-change events, so this never touches the IPC socket.
         
         Returns:
             Tuple of (position, duration, percentage) in seconds.
             Returns (0, 0, 0) if player not running or IPC unavailable.
         """
-        if not self.player_process or self.player_process.poll() is not None:
-            return (0, 0, 0)
-        
-        if not self.ipc_socket or not Path(self.ipc_socket).exists():
-            return (0, 0, 0)
-        
-        try:
-            # Connect to mpv IPC socket
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.settimeout(0.5)  # Short timeout to avoid blocking
-            sock.connect(self.ipc_socket)
-            
-            # Get current position (time-pos in seconds)
-            pos_cmd = {"command": ["get_property", "time-pos"]}
-            sock.send((json.dumps(pos_cmd) + "\n").encode('utf-8'))
-            pos_response = sock.recv(1024).decode('utf-8')
-            pos_result = json.loads(pos_response)
-            
-            # Get duration (duration in seconds)
-            dur_cmd = {"command": ["get_property", "duration"]}
-            sock.send((json.dumps(dur_cmd) + "\n").encode('utf-8'))
-            dur_response = sock.recv(1024).decode('utf-8')
-            dur_result = json.loads(dur_response)
-            
-            sock.close()
-            
-            # Extract position and duration from responses
-            position = 0.0
-            duration = 0.0
-            
-            if 'data' in pos_result and pos_result['data'] is not None:
-                position = float(pos_result['data'])
-            
-            if 'data' in dur_result and dur_result['data'] is not None:
-                duration = float(dur_result['data'])
-            
-            if duration > 0:
-                # Calculate percentage, clamped between 0 and 100
-                percentage = min(100, max(0, (position / duration) * 100))
-                return (position, duration, percentage)
-            
-        except (ConnectionRefusedError, FileNotFoundError, OSError, socket.error, 
-                json.JSONDecodeError, KeyError, ValueError, TimeoutError):
-            # IPC failed or invalid data, return zeros
-            pass
-        
-        return (0, 0, 0)
+        return self._progress
     
     def check_player_status(self):
         """
         Check if the player process is still running.
         
-        If the process has finished (song ended), automatically advances
-        to the next song in the playlist.
+        mpv advances through the playlist on its own, so it only exits if
+        it crashed or was closed externally. In that case playback resumes
+        with a new mpv at the next song in the playlist.
         """
         if self.player_process:
             # poll() returns None if process is still running
             # Returns exit code if process has finished
             if self.player_process.poll() is not None:
-                # Song finished, play next song automatically
+                # Player went away, continue with the next song
                 self.next_song()
+                self._dirty["status"] = True
+                self._dirty["progress"] = True
     
     def draw(self):
         """
-        Render the complete user interface.
+        Render the parts of the user interface that changed.
         
-        Draws all UI elements including title, shuffle indicator, playlist list,
-        current song info, progress bar, and help text. Uses cyberpunk color
-        scheme throughout.
+        The screen is split into regions (status, playlist, progress, help),
+        each with a dirty flag in self._dirty. Only dirty regions are
+        repainted, and all changes are flushed to the terminal with a single
+        doupdate(). Does nothing at all if no region is dirty.
         """
+        if not any(self._dirty.values()):
+            return
+        
         height, width = self.stdscr.getmaxyx()
         
-        # Only clear screen if size changed, otherwise just refresh
-        if not hasattr(self, '_last_height') or not hasattr(self, '_last_width') or \
-           self._last_height != height or self._last_width != width:
-            self.stdscr.clear()
-            self._last_height = height
-            self._last_width = width
-        # Don't clear/erase every frame - just redraw over existing content
+        if self._dirty["status"]:
+            self._dirty["status"] = False
+            self._draw_status(height, width)
+        
+        if self._dirty["playlist"]:
+            self._dirty["playlist"] = False
+            self._draw_playlist(height, width)
+        
+        if self._dirty["progress"]:
+            self._dirty["progress"] = False
+            self._draw_progress(height, width)
         
+        if self._dirty["help"]:
+            self._dirty["help"] = False
+            self._draw_help(height, width)
+        
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+    
+    def _draw_status(self, height: int, width: int):
+        """
+        Draw the title, shuffle indicator and current song info.
+        
+        Args:
+            height: Screen height
+            width: Screen width
+        """
         # Title - Cyberpunk style with neon cyan
         title = "╔═══ MUSIC PLAYER ═══╗"
         title_x = (width - len(title)) // 2
-        self.stdscr.addstr(0, title_x, title, curses.color_pair(5) | curses.A_BOLD)
+        self._draw_line(0, ((title_x, title, self.ATTR_TITLE),))
         
         # Shuffle indicator - Neon yellow
         shuffle_text = "▶ [S]huffle: " + ("ON" if self.shuffle else "OFF")
-        # Clear the line first to avoid leftover characters
-        try:
-            self.stdscr.addstr(1, 2, " " * (width - 4))  # Clear the line
-        except curses.error:
-            pass
+        self._draw_line(1, ((2, shuffle_text, self.ATTR_SHUFFLE),))
+        
+        # Current song info
+        if self.current_song_info:
+            info_y = height - 5
+            if self.player_process is None:
+                status = "■ STOPPED"
+                status_color = self.ATTR_NORMAL
+            elif self.paused:
+                status = "⏸ PAUSED"
+                status_color = self.ATTR_PAUSED  # Red for paused
+            else:
+                status = "▶ PLAYING"
+                status_color = self.ATTR_PLAYING  # Green for playing
+            
+            # Draw status and song info separately for color coding
+            song_info_x = 2 + len(status) + 3  # 3 for " ─ "
+            song_info_text = self.current_song_info
+            if len(song_info_text) > width - song_info_x - 2:
+                song_info_text = song_info_text[:width - song_info_x - 5] + "..."
+            self._draw_line(info_y, (
+                (2, status, status_color),
+                (song_info_x, song_info_text, self.ATTR_NORMAL),
+            ))
+    
+    def _draw_line(self, y: int, segments: Tuple[Tuple[int, str, int], ...]):
+        """
+        Draw a line made of (x, text, attr) segments.
+        
+        Lines are compared against what was last drawn at the same row, and
+        unchanged lines are skipped. A changed line is cleared from its first
+        segment to the end, so shorter content leaves nothing behind.
+        
+        Args:
+            y: Screen row
+            segments: Tuple of (x, text, attr) to draw in order
+        """
+        if self._line_cache.get(y) == segments:
+            return
+        self._line_cache[y] = segments
+        
         try:
-            self.stdscr.addstr(1, 2, shuffle_text, curses.color_pair(3) | curses.A_BOLD)
+            self.stdscr.move(y, segments[0][0])
+            self.stdscr.clrtoeol()
+            for x, text, attr in segments:
+                self.stdscr.addstr(y, x, text, attr)
         except curses.error:
+            # Writing into the last column raises, the text is drawn anyway
             pass
+    
+    def _handle_resize(self):
+        """
+        Prepare for a full repaint after the terminal was resized.
         
-        # Playlists list
-        # Start after title and shuffle indicator
-        list_start_y = 3
-        # Adjust list end to leave space for song info, progress bar, and help
-        list_end_y = height - 7  # Leave space: song info (height-5), progress (height-4), help (height-1)
+        Uses erase() rather than clear(): only curses' virtual screen is
+        blanked, so the next doupdate() sends the differences instead of
+        wiping and repainting the whole terminal, which flickers.
+        """
+        self.stdscr.erase()
+        self._line_cache = {}
+        self._drawn_bar = None
+        self._dirty = dict.fromkeys(self._dirty, True)
+        self._rebuild_row_cache()
+    
+    def _rebuild_row_cache(self):
+        """
+        Precompute the rendered playlist rows for the current screen width.
         
-        for i, playlist in enumerate(self.playlists):
-            y = list_start_y + i
-            if y >= list_end_y:
-                break
-            
+        Each row is stored as (prefix, prefix_attr, text, text_attr), already
+        truncated to fit, so drawing the list needs no string formatting.
+        Must be called whenever the selection, the playing playlist or the
+        screen size changes. Also marks the playlist region dirty.
+        """
+        height, width = self.stdscr.getmaxyx()
+        # Leave space: song info (height-5), progress (height-4), help (height-1)
+        max_rows = max(0, height - 7 - 3)
+        
+        rows = []
+        for i, playlist in enumerate(self.playlists[:max_rows]):
             # Highlight selected item with magenta background
             if i == self.selected_index:
-                attr = curses.color_pair(1) | curses.A_BOLD
+                attr = self.ATTR_SELECTED
             else:
-                attr = curses.color_pair(4)
+                attr = self.ATTR_NORMAL
             
             # Show playing indicator with green
             if playlist == self.current_playlist:
                 prefix = "▶ "
-                prefix_attr = curses.color_pair(2) | curses.A_BOLD
+                prefix_attr = self.ATTR_PLAYING
             else:
                 prefix = "  "
-                prefix_attr = curses.color_pair(4)
-            
-            text = f"{prefix}{playlist}"
+                prefix_attr = self.ATTR_NORMAL
             
             # Truncate if too long
-            if len(text) > width - 4:
-                text = text[:width - 7] + "..."
-            
-            # Draw prefix and playlist name separately for color coding
-            self.stdscr.addstr(y, 2, prefix, prefix_attr)
             playlist_name = playlist
             if len(playlist_name) > width - 6:
                 playlist_name = playlist_name[:width - 9] + "..."
-            self.stdscr.addstr(y, 2 + len(prefix), playlist_name, attr)
+            rows.append((prefix, prefix_attr, playlist_name, attr))
         
-        # Current song info
-        if self.current_song_info:
-            info_y = height - 5
-            if self.paused:
-                status = "⏸ PAUSED"
-                status_color = curses.color_pair(6) | curses.A_BOLD  # Red for paused
-            else:
-                status = "▶ PLAYING"
-                status_color = curses.color_pair(2) | curses.A_BOLD  # Green for playing
+        self._row_cache = rows
+        self._dirty["playlist"] = True
+    
+    def _draw_playlist(self, height: int, width: int):
+        """
+        Draw the list of playlists from the precomputed row cache.
+        
+        Args:
+            height: Screen height
+            width: Screen width
+        """
+        # Start after title and shuffle indicator
+        y = 3
+        for prefix, prefix_attr, text, text_attr in self._row_cache:
+            # Draw prefix and playlist name separately for color coding
+            self.stdscr.addstr(y, 2, prefix, prefix_attr)
+            self.stdscr.addstr(y, 4, text, text_attr)
+            y += 1
+    
+    def _draw_progress(self, height: int, width: int):
+        """
+        Draw the progress bar and elapsed/total time of the current song.
+        
+        Args:
+            height: Screen height
+            width: Screen width
+        """
+        if not self.current_song_info:
+            return
+        
+        progress_y = height - 4
+        position, duration, percentage = self.get_progress()
+        
+        if duration <= 0:
+            # Nothing to show (yet), clear whatever the last song left
+            self.stdscr.move(progress_y, 2)
+            self.stdscr.clrtoeol()
+            self._drawn_bar = None
+        else:
+            # Format time as MM:SS
+            def format_time(seconds):
+                mins = int(seconds // 60)
+                secs = int(seconds % 60)
+                return f"{mins:02d}:{secs:02d}"
             
-            info_text = f"{status} ─ {self.current_song_info}"
-            # Truncate if too long
-            if len(info_text) > width - 4:
-                info_text = info_text[:width - 7] + "..."
+            time_text = f"{format_time(position)} / {format_time(duration)}"
+            time_width = len(time_text)
             
-            # Draw status and song info separately for color coding
-            self.stdscr.addstr(info_y, 2, status, status_color)
-            song_info_x = 2 + len(status) + 3  # 3 for " ─ "
-            song_info_text = self.current_song_info
-            if len(song_info_text) > width - song_info_x - 2:
-                song_info_text = song_info_text[:width - song_info_x - 5] + "..."
-            self.stdscr.addstr(info_y, song_info_x, song_info_text, curses.color_pair(4))
-        
-        # Progress bar
-        if self.current_song_info:
-            progress_y = height - 4
-            position, duration, percentage = self.get_progress()
+            # Calculate bar width (leave space for time on the right)
+            bar_width = width - time_width - 8  # 8 for margins and spacing
+            if bar_width < 10:
+                bar_width = width - 4  # Fallback if too narrow
+                time_text = ""  # Hide time if no space
+                time_width = 0
             
-            # Clear the progress bar line first
-            try:
-                self.stdscr.addstr(progress_y, 2, " " * (width - 4))
-            except curses.error:
-                pass
+            bar_width = min(bar_width, self.MAX_BAR)
             
-            if duration > 0:
-                # Format time as MM:SS
-                def format_time(seconds):
-                    mins = int(seconds // 60)
-                    secs = int(seconds % 60)
-                    return f"{mins:02d}:{secs:02d}"
-                
-                time_text = f"{format_time(position)} / {format_time(duration)}"
-                time_width = len(time_text)
-                
-                # Calculate bar width (leave space for time on the right)
-                bar_width = width - time_width - 8  # 8 for margins and spacing
-                if bar_width < 10:
-                    bar_width = width - 4  # Fallback if too narrow
-                    time_text = ""  # Hide time if no space
-                    time_width = 0
-                
-                # Calculate filled portion based on percentage
-                filled = int((percentage / 100.0) * bar_width)
-                filled = max(0, min(bar_width, filled))
-                
-                # Draw progress bar
-                bar_start_x = 2
-                
-                # Draw filled portion
-                if filled > 0:
-                    filled_chars = "█" * filled
-                    try:
-                        self.stdscr.addstr(progress_y, bar_start_x, filled_chars, curses.color_pair(7) | curses.A_BOLD)
-                    except curses.error:
-                        pass
-                
-                # Draw unfilled portion
-                if filled < bar_width:
-                    unfilled_chars = "░" * (bar_width - filled)
-                    try:
-                        self.stdscr.addstr(progress_y, bar_start_x + filled, unfilled_chars, curses.color_pair(8))
-                    except curses.error:
-                        pass
+            # Calculate filled portion based on percentage
+            filled = int((percentage / 100.0) * bar_width)
+            filled = max(0, min(bar_width, filled))
+            
+            # Draw progress bar
+            bar_start_x = 2
+            
+            # The bar only moves every few seconds, skip it while unchanged
+            if self._drawn_bar != (filled, bar_width):
+                last_filled = None
+                if self._drawn_bar is not None and self._drawn_bar[1] == bar_width:
+                    last_filled = self._drawn_bar[0]
+                self._drawn_bar = (filled, bar_width)
                 
-                # Draw time on the right
-                if time_text and bar_start_x + bar_width + 3 + time_width <= width - 2:
+                if last_filled is not None and filled > last_filled:
+                    # Playback moved forward, only paint the newly filled cells
                     try:
-                        self.stdscr.addstr(progress_y, bar_start_x + bar_width + 3, time_text, curses.color_pair(4) | curses.A_BOLD)
+                        self.stdscr.addstr(progress_y, bar_start_x + last_filled,
+                                           self._full_bar[:filled - last_filled],
+                                           self.ATTR_BAR_FILLED)
                     except curses.error:
                         pass
+                else:
+                    # New song, seek backwards or new width: repaint the whole bar
+                    # Draw filled portion
+                    if filled > 0:
+                        filled_chars = self._full_bar[:filled]
+                        try:
+                            self.stdscr.addstr(progress_y, bar_start_x, filled_chars, self.ATTR_BAR_FILLED)
+                        except curses.error:
+                            pass
+                    
+                    # Draw unfilled portion
+                    if filled < bar_width:
+                        unfilled_chars = self._empty_bar[:bar_width - filled]
+                        try:
+                            self.stdscr.addstr(progress_y, bar_start_x + filled, unfilled_chars, self.ATTR_BAR_EMPTY)
+                        except curses.error:
+                            pass
+            
+            # Draw time on the right, including the gap after the bar so
+            # the whole line is overwritten and needs no clearing
+            if time_text and bar_start_x + bar_width + 3 + time_width <= width - 2:
+                try:
+                    self.stdscr.addstr(progress_y, bar_start_x + bar_width, "   " + time_text, self.ATTR_TIME)
+                except curses.error:
+                    pass
+    
+    def _draw_help(self, height: int, width: int):
+        """
+        Draw the key binding help line at the bottom of the screen.
         
+        Args:
+            height: Screen height
+            width: Screen width
+        """
         # Help text - Cyberpunk style border
         help_y = height - 1
         help_text = "↑↓ Navigate | Enter Play | Space Play/Pause | S Shuffle | N Next | P Prev | Q Quit"
         if len(help_text) > width - 2:
             help_text = help_text[:width - 3]
         # Draw with subtle styling
-        self.stdscr.addstr(help_y, 1, help_text, curses.color_pair(4))
-        
-        self.stdscr.refresh()
+        self.stdscr.addstr(help_y, 1, help_text, self.ATTR_NORMAL)
     
     def run(self):
         """
@@ -686,6 +1357,7 @@ class MusicPlayer:
         """
         # Load playlists at startup
         self.playlists = self.load_playlists()
+        self._n_playlists = len(self.playlists)
         
         # Show message if no playlists found
         if not self.playlists:
@@ -695,101 +1367,244 @@ class MusicPlayer:
             self.stdscr.refresh()
             self.stdscr.nodelay(0)  # Blocking input
             self.stdscr.getch()
+            self._close_wake_pipe()
             return
         
-        # Main event loop
+        self._rebuild_row_cache()
+        try:
+            self._event_loop()
+        finally:
+            # Clean up on exit, also when interrupted with Ctrl+C
+            self.stop_playback()
+            # Let running lookups finish (ffprobe times out after 0.5s) so
+            # their results make it into the saved metadata cache
+            self._prefetch_pool.shutdown(wait=True, cancel_futures=True)
+            self._ipc_pool.shutdown(wait=False, cancel_futures=True)
+            self._save_meta_cache()
+            self._close_wake_pipe()
+    
+    def _event_loop(self):
+        """
+        Handle keyboard input and redraw the UI until the user quits.
+        
+        Kept separate from run() so cleanup happens in a single finally block.
+        Sleeps in select() until a key is pressed, the wake pipe is written
+        (new progress from mpv, terminal resize) or one second passes, so an
+        idle player does not wake up constantly. While paused or stopped
+        there is nothing to poll, so it sleeps until the next event.
+        """
+        stdin_fd = sys.stdin.fileno()
         while True:
             # Check if current song finished and advance if needed
             self.check_player_status()
             
-            # Redraw the entire UI
+            # Redraw the parts of the UI that changed
             self.draw()
             
-            # Get keyboard input (non-blocking, returns -1 if no input)
-            key = self.stdscr.getch()
+            # The timeout only serves to notice a dead mpv while playing;
+            # the progress thread also wakes us when its connection drops
+            idle = self.paused or self.player_process is None
+            ready, _, _ = select.select([stdin_fd, self._wake_r], [], [], None if idle else 1.0)
             
-            if key == -1:
-                continue  # No input, continue loop
+            if self._wake_r in ready:
+                try:
+                    os.read(self._wake_r, 4096)  # Drain pending wakeups
+                except BlockingIOError:
+                    pass
+                self._check_resize()
             
-            # Handle keyboard shortcuts
-            if key == ord('q') or key == ord('Q') or key == 27:  # Q or ESC - quit
-                break
-            elif key == curses.KEY_UP or key == ord('k'):  # Navigate up
-                self.selected_index = (self.selected_index - 1) % len(self.playlists)
-            elif key == curses.KEY_DOWN or key == ord('j'):  # Navigate down
-                self.selected_index = (self.selected_index + 1) % len(self.playlists)
-            elif key == ord('\n') or key == ord('\r'):  # Enter - play selected playlist
-                selected_playlist = self.playlists[self.selected_index]
-                self.start_playlist(selected_playlist)
-            elif key == ord('s') or key == ord('S'):  # Toggle shuffle
-                self.toggle_shuffle()
-            elif key == ord(' '):  # Space - play/pause
-                self.toggle_play_pause()
-            elif key == ord('n') or key == ord('N'):  # Next song
-                self.next_song()
-            elif key == ord('p') or key == ord('P'):  # Previous song
-                self.previous_song()
+            # Handle every key curses has buffered (getch returns -1 when empty)
+            while True:
+                key = self.stdscr.getch()
+                if key == -1:
+                    break
+                if not self.handle_key(key):
+                    return
+    
+    def _wake(self):
+        """
+        Wake the main loop from select(). Safe to call from any thread.
         
-        # Clean up on exit
-        self.stop_playback()
+        Does nothing once the wake pipe has been closed, since background
+        threads may still finish after the main loop exited.
+        """
+        wake_w = self._wake_w
+        if wake_w is None:
+            return
+        try:
+            os.write(wake_w, b"\0")
+        except BlockingIOError:
+            pass  # Pipe full, a wakeup is already pending
+        except OSError:
+            pass  # Pipe closed while we were writing
+    
+    def _close_wake_pipe(self):
+        """
+        Restore the previous SIGWINCH handler and close the wake pipe.
+        
+        The write end is cleared before it is closed so late _wake() calls
+        return instead of writing to a closed (or reused) file descriptor.
+        """
+        signal.signal(signal.SIGWINCH, self._prev_sigwinch)
+        wake_w, self._wake_w = self._wake_w, None
+        os.close(wake_w)
+        os.close(self._wake_r)
+    
+    def _check_resize(self):
+        """
+        Let curses pick up a new terminal size after SIGWINCH.
+        
+        The SIGWINCH handler only wakes the main loop, so the new size is
+        applied here and every region is scheduled for a repaint.
+        """
+        try:
+            columns, lines = os.get_terminal_size(sys.stdout.fileno())
+        except OSError:
+            return
+        if curses.is_term_resized(lines, columns):
+            curses.resize_term(lines, columns)
+            self._handle_resize()
+    
+    def handle_key(self, key: int) -> bool:
+        """
+        Handle a single keyboard shortcut.
+        
+        Args:
+            key: Key code returned by getch()
+        
+        Returns:
+            False if the user asked to quit, True otherwise.
+        """
+        if key == ord('q') or key == ord('Q') or key == 27:  # Q or ESC - quit
+            return False
+        elif key == curses.KEY_UP or key == ord('k'):  # Navigate up
+            self.selected_index = (self.selected_index - 1) % self._n_playlists
+            self._rebuild_row_cache()
+        elif key == curses.KEY_DOWN or key == ord('j'):  # Navigate down
+            self.selected_index = (self.selected_index + 1) % self._n_playlists
+            self._rebuild_row_cache()
+        elif key == ord('\n') or key == ord('\r'):  # Enter - play selected playlist
+            selected_playlist = self.playlists[self.selected_index]
+            self.start_playlist(selected_playlist)
+            self._rebuild_row_cache()
+        elif key == ord('s') or key == ord('S'):  # Toggle shuffle
+            self.toggle_shuffle()
+        elif key == ord(' '):  # Space - play/pause
+            self.toggle_play_pause()
+        elif key == ord('n') or key == ord('N'):  # Next song
+            self.next_song()
+        elif key == ord('p') or key == ord('P'):  # Previous song
+            self.previous_song()
+        elif key == curses.KEY_RESIZE:  # Terminal resized, curses already knows
+            self._handle_resize()
+        
+        # Any key may change the playback state. A paused song's progress
+        # can't have moved, so it isn't repainted.
+        self._dirty["status"] = True
+        if not self.paused:
+            self._dirty["progress"] = True
+        return True
 
 
 # ============================================================================
 # Dependency Checking Functions
 # ============================================================================
 
-def check_dependencies():
+def _check_dependencies_impl():
     """
-    Check if all required dependencies are available.
+    Run the dependency checks, without caching.
     
-    Checks for:
-    - mpv media player installation
-    - Playlists directory existence
-    - Presence of .m3u8 playlist files
+    See check_dependencies() for what is checked.
     
     Returns:
-        List of issue dictionaries, each containing:
-        - 'type': Issue category (mpv, directory, playlists)
-        - 'message': Description of the issue
-        - 'fix': Instructions on how to fix the issue
+        List of issue dictionaries, empty if everything is in place
     """
     issues = []
     
-    # Check if mpv is installed and accessible
-    try:
-        subprocess.run(
-            [PLAYER_CMD, '--version'], 
-            stdout=subprocess.DEVNULL, 
-            stderr=subprocess.DEVNULL,
-            timeout=1
-        )
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+    # Check if mpv is installed and accessible (a PATH lookup, no need to run it)
+    if shutil.which(PLAYER_CMD) is None:
         issues.append({
             'type': 'mpv',
             'message': f'{PLAYER_CMD} is not installed or not in PATH',
             'fix': f'Install {PLAYER_CMD}:\n  Arch: sudo pacman -S mpv\n  Debian/Ubuntu: sudo apt install mpv\n  Fedora: sudo dnf install mpv'
         })
     
-    # Check if playlists directory exists
-    if not PLAYLISTS_DIR.exists():
+    # Check that the playlists directory exists and has any .m3u8 playlist
+    # files, stopping at the first one. A single scandir answers both.
+    # is_file() uses the cached entry type, it only stats symlinks.
+    try:
+        with os.scandir(PLAYLISTS_DIR) as it:
+            has_m3u8 = any(
+                entry.name.endswith(".m3u8") and entry.is_file()
+                for entry in it
+            )
+    except PermissionError:
+        # The directory is there but can't be listed, so no playlists
+        has_m3u8 = False
+    except (FileNotFoundError, NotADirectoryError):
+        has_m3u8 = None  # Not a playlists issue, reported right here
         issues.append({
             'type': 'directory',
             'message': f'Playlists directory does not exist: {PLAYLISTS_DIR}',
             'fix': f'Create the directory:\n  mkdir -p {PLAYLISTS_DIR}'
         })
-    else:
-        # Check if there are any .m3u8 playlist files
-        m3u8_files = list(PLAYLISTS_DIR.glob("*.m3u8"))
-        if not m3u8_files:
-            issues.append({
-                'type': 'playlists',
-                'message': f'No .m3u8 playlist files found in {PLAYLISTS_DIR}',
-                'fix': f'Add .m3u8 playlist files to:\n  {PLAYLISTS_DIR}\n\nExample playlist format:\n  #EXTM3U\n  /path/to/song1.mp3\n  /path/to/song2.mp3'
-            })
+    
+    if has_m3u8 is False:
+        issues.append({
+            'type': 'playlists',
+            'message': f'No .m3u8 playlist files found in {PLAYLISTS_DIR}',
+            'fix': f'Add .m3u8 playlist files to:\n  {PLAYLISTS_DIR}\n\nExample playlist format:\n  #EXTM3U\n  /path/to/song1.mp3\n  /path/to/song2.mp3'
+        })
     
     return issues
 
 
+@functools.lru_cache(maxsize=1)
+def _deps_cached(player_cmd, playlists_dir, mtime_ns):
+    """
+    Cache the dependency check result for one set of inputs.
+    
+    The arguments aren't used by the checks themselves, they only form the
+    cache key, so changing any of them runs the checks again.
+    
+    Args:
+        player_cmd: Player command that is looked up on PATH
+        playlists_dir: Directory that should hold the playlists
+        mtime_ns: Modification time of playlists_dir, 0 if it can't be read
+    
+    Returns:
+        Tuple of issue dictionaries, see check_dependencies()
+    """
+    return tuple(_check_dependencies_impl())
+
+
+def check_dependencies():
+    """
+    Check if all required dependencies are available.
+    
+    The result is cached for as long as the player command, the playlists
+    directory and that directory's mtime stay the same, so repeated calls
+    skip the filesystem checks.
+    
+    Checks for:
+    - mpv media player installation
+    - Playlists directory existence
+    - Presence of .m3u8 playlist files
+    
+    Returns:
+        List of issue dictionaries, each containing:
+        - 'type': Issue category (mpv, directory, playlists)
+        - 'message': Description of the issue
+        - 'fix': Instructions on how to fix the issue
+    """
+    try:
+        mtime_ns = PLAYLISTS_DIR.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0  # Missing or unreadable, the checks report why
+    # Hand out copies of the issues so callers can't modify the cached result
+    return [dict(issue) for issue in _deps_cached(PLAYER_CMD, PLAYLISTS_DIR, mtime_ns)]
+
+
 def show_dependency_info(stdscr, issues):
     """
     Display a formatted info box showing missing dependencies and how to fix them.
@@ -820,8 +1635,9 @@ def show_dependency_info(stdscr, issues):
     
     # Calculate box dimensions (ensure minimum size and fit on screen)
     max_width = min(80, max(40, width - 4))
-    # Calculate needed height based on content
-    needed_height = 5 + sum(3 + len(issue['fix'].split('\n')) for issue in issues)
+    # Calculate needed height based on content (fix lines are split once here)
+    fix_lines_per_issue = [issue['fix'].split('\n') for issue in issues]
+    needed_height = 5 + sum(3 + len(fix_lines) for fix_lines in fix_lines_per_issue)
     box_height = min(max(needed_height, 10), height - 4, 30)
     
     # Calculate box position (centered, but ensure it fits on screen)
@@ -830,67 +1646,76 @@ def show_dependency_info(stdscr, issues):
     
     stdscr.clear()
     
+    # Every row is collected as (y, x, text, attr) and drawn in one pass at
+    # the end. The horizontal rule is shared by all three borders.
+    rows = []
+    hrule = "═" * (max_width - 2)
+    top_border = "╔" + hrule + "╗"
+    middle_border = "╠" + hrule + "╣"
+    bottom_border = "╚" + hrule + "╝"
+    
+    # Color attributes, looked up once instead of per row
+    border_attr = curses.color_pair(5) | curses.A_BOLD
+    title_attr = curses.color_pair(6) | curses.A_BOLD
+    issue_attr = curses.color_pair(6)
+    fix_attr = curses.color_pair(4)
+    
     # Draw box border with cyberpunk style (box-drawing characters)
     box_title = "╔═══ DEPENDENCY CHECK ═══╗"
     title_x = box_x + (max_width - len(box_title)) // 2
     
     # Draw top border and title
-    stdscr.addstr(box_y, box_x, "╔" + "═" * (max_width - 2) + "╗", curses.color_pair(5) | curses.A_BOLD)
-    stdscr.addstr(box_y + 1, title_x, box_title, curses.color_pair(6) | curses.A_BOLD)
-    stdscr.addstr(box_y + 2, box_x, "╠" + "═" * (max_width - 2) + "╣", curses.color_pair(5) | curses.A_BOLD)
+    rows.append((box_y, box_x, top_border, border_attr))
+    rows.append((box_y + 1, title_x, box_title, title_attr))
+    rows.append((box_y + 2, box_x, middle_border, border_attr))
     
     # Draw content area
     y_offset = box_y + 3
     content_width = max_width - 4
     
-    stdscr.addstr(y_offset, box_x + 2, "Missing Dependencies:", curses.color_pair(6) | curses.A_BOLD)
+    rows.append((y_offset, box_x + 2, "Missing Dependencies:", title_attr))
     y_offset += 2
     
+    # Wraps on spaces only, lines that fit keep their indentation
+    wrapper = textwrap.TextWrapper(width=content_width, break_long_words=False, break_on_hyphens=False)
+    
     # Display each issue with its fix instructions
     for i, issue in enumerate(issues):
         # Issue type and message
-        issue_text = f"[{issue['type'].upper()}] {issue['message']}"
-        if len(issue_text) > content_width:
-            issue_text = issue_text[:content_width - 3] + "..."
-        stdscr.addstr(y_offset, box_x + 2, issue_text, curses.color_pair(6))
+        full_text = f"[{issue['type'].upper()}] {issue['message']}"
+        issue_text = full_text if len(full_text) <= content_width else full_text[:content_width - 3] + "..."
+        rows.append((y_offset, box_x + 2, issue_text, issue_attr))
         y_offset += 1
         
         # Fix instructions with word wrapping
-        fix_lines = issue['fix'].split('\n')
-        for line in fix_lines:
+        for line in fix_lines_per_issue[i]:
             if y_offset >= box_y + box_height - 3:
                 break  # Don't overflow the box
-            if len(line) > content_width:
-                # Wrap long lines by splitting on words
-                words = line.split()
-                current_line = ""
-                for word in words:
-                    if len(current_line + " " + word) <= content_width:
-                        current_line += (" " if current_line else "") + word
-                    else:
-                        # Output current line and start new one
-                        if current_line:
-                            stdscr.addstr(y_offset, box_x + 4, current_line, curses.color_pair(4))
-                            y_offset += 1
-                        current_line = word
-                if current_line:
-                    stdscr.addstr(y_offset, box_x + 4, current_line, curses.color_pair(4))
-                    y_offset += 1
-            else:
-                # Line fits, output as-is
-                stdscr.addstr(y_offset, box_x + 4, line, curses.color_pair(4))
+            for wrapped in wrapper.wrap(line) or [""]:
+                rows.append((y_offset, box_x + 4, wrapped, fix_attr))
                 y_offset += 1
         y_offset += 1  # Space between issues
     
     # Draw bottom border
-    stdscr.addstr(box_y + box_height - 2, box_x, "╚" + "═" * (max_width - 2) + "╝", curses.color_pair(5) | curses.A_BOLD)
+    rows.append((box_y + box_height - 2, box_x, bottom_border, border_attr))
     
     # Instructions for user
     help_text = "Press any key to exit..."
     help_x = box_x + (max_width - len(help_text)) // 2
-    stdscr.addstr(box_y + box_height - 1, help_x, help_text, curses.color_pair(4))
+    rows.append((box_y + box_height - 1, help_x, help_text, fix_attr))
+    
+    # Draw into an off-screen pad the size of the box and copy it to the
+    # screen with a single doupdate()
+    pad = curses.newpad(box_height + 1, max_width + 1)
+    addstr = pad.addstr
+    for y, x, text, attr in rows:
+        if y - box_y < box_height:  # Content that runs past the box is cut off
+            addstr(y - box_y, x - box_x, text, attr)
     
-    stdscr.refresh()
+    stdscr.noutrefresh()
+    pad.noutrefresh(0, 0, box_y, box_x,
+                    min(box_y + box_height, height - 1), min(box_x + max_width, width - 1))
+    curses.doupdate()
     
     # Wait for key press (blocking)
     stdscr.nodelay(0)
@@ -914,7 +1739,7 @@ def main():
     if issues:
         # Show dependency info box if issues found
         try:
-            curses.wrapper(lambda stdscr: show_dependency_info(stdscr, issues))
+            curses.wrapper(show_dependency_info, issues)
         except KeyboardInterrupt:
             pass
         sys.exit(1)